@@ -11,30 +11,73 @@ Usage:
   # Export to a specific folder:
   python export_playlist.py --all --out "C:\path\to\folder"
 
+  # Fetch more playlists in parallel when exporting all:
+  python export_playlist.py --all --concurrency 16
+
 """
 import argparse
 import csv
+import hashlib
 import json
 import os
 import re
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import chain, islice
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ytmusicapi import YTMusic
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Library listing cache used by --name (title/playlistId pairs only), one
+# file per account: library-<account key>.json
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'yt-playlist-importer')
+LIBRARY_CACHE_TTL = 3600
+
+# ytmusicapi applies this itself only to sessions it creates
+HTTP_TIMEOUT = 30
+
+_FN_BAD_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_FN_WS_RE = re.compile(r'\s+')
+
 def _sanitize_filename(name: str) -> str:
     if not name:
         return "playlist"
     name = name.strip()
-    name = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '', name)
-    name = re.sub(r'\s+', ' ', name)
+    name = _FN_BAD_RE.sub('', name)
+    name = _FN_WS_RE.sub(' ', name)
     return name[:240] or "playlist"
 
+def _read_json(path):
+    """Load a JSON file, using orjson's faster parser when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path, obj, indent=False):
+    """Write obj as UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2 if indent else None)
+
 def _ensure_browser_json():
     if not os.path.exists('browser.json'):
         print("ERROR: browser.json not found. Run this script with --setup or run: ytmusicapi browser")
         sys.exit(1)
     try:
-        with open('browser.json', 'r', encoding='utf-8') as f:
-            headers = json.load(f)
+        headers = _read_json('browser.json')
     except Exception as e:
         print(f"ERROR reading browser.json: {e}")
         sys.exit(1)
@@ -60,12 +103,104 @@ def _ensure_browser_json():
 
     if changed:
         try:
-            with open('browser.json', 'w', encoding='utf-8') as f:
-                json.dump(headers, f, indent=2)
+            _write_json('browser.json', headers, indent=True)
             print("Updated browser.json with defaults to avoid missing-value errors.")
         except Exception:
             pass
 
+_SAPISID_RE = re.compile(r'(?:^|;)\s*SAPISID=([^;]*)')
+
+def _account_key(auth_file='browser.json'):
+    """
+    Short hash of the login in auth_file (SAPISID cookie and
+    X-Goog-AuthUser), so data cached for one account is never used for
+    another. Logging in again just starts a fresh cache.
+    """
+    try:
+        headers = _read_json(auth_file)
+    except Exception:
+        return 'default'
+    cookie = headers.get('Cookie') or headers.get('cookie') or ''
+    m = _SAPISID_RE.search(cookie)
+    user = headers.get('X-Goog-AuthUser') or headers.get('x-goog-authuser') or '0'
+    login = f"{m.group(1) if m else cookie}\0{user}"
+    return hashlib.sha256(login.encode('utf-8')).hexdigest()[:16]
+
+def _build_session(pool_size=20):
+    """
+    Keep-alive session with pooled connections and HTTP-level retries.
+    Every ytmusicapi call is a POST; the exporter only reads, so they are
+    safe to re-send after a server error. Requests time out after
+    HTTP_TIMEOUT seconds unless they pass their own.
+    pool_size should be at least the number of threads sharing the session;
+    requests beyond it open a fresh connection that is thrown away after use.
+    """
+    session = requests.Session()
+    session.request = partial(session.request, timeout=HTTP_TIMEOUT)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+def _cached_library(yt, ttl=LIBRARY_CACHE_TTL, refresh=False):
+    """
+    Return the library playlists, reusing this account's cached listing if
+    it is younger than `ttl` seconds. Returns (playlists, from_cache).
+    """
+    cache_file = os.path.join(CACHE_DIR, f"library-{_account_key()}.json")
+    if not refresh:
+        try:
+            if time.time() - os.path.getmtime(cache_file) < ttl:
+                return _read_json(cache_file), True
+        except Exception:
+            pass
+
+    pls = [
+        {'playlistId': pl.get('playlistId'), 'title': pl.get('title')}
+        for pl in yt.get_library_playlists(limit=None) or []
+    ]
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = cache_file + '.tmp'
+        _write_json(tmp_path, pls)
+        os.replace(tmp_path, cache_file)
+    except Exception:
+        pass
+    return pls, False
+
+def _norm_title(title):
+    return (title or '').strip().casefold()
+
+def _find_playlists(pls, name, substring=True):
+    target = _norm_title(name)
+    matches = [pl for pl in pls if _norm_title(pl.get('title')) == target]
+    if not matches and substring:
+        matches = [pl for pl in pls if target in _norm_title(pl.get('title'))]
+    return matches
+
+def _lookup_playlist(yt, name, refresh=False):
+    """
+    Find the library playlist to export for `name`: an exact title match,
+    else the first substring match. A cached listing without an exact match
+    is refetched first, so a newly created "Rock" beats a cached "Rock
+    Classics". Returns (playlist or None, from_cache, number of matches).
+    """
+    pls, from_cache = _cached_library(yt, refresh=refresh)
+    matches = _find_playlists(pls, name, substring=False)
+    if not matches and from_cache:
+        # Playlist may have been created since the listing was cached
+        pls, from_cache = _cached_library(yt, refresh=True)
+        matches = _find_playlists(pls, name, substring=False)
+    if not matches:
+        matches = _find_playlists(pls, name)
+    return (matches[0] if matches else None), from_cache, len(matches)
+
 def _get_playlist_tracks(yt, playlist_id):
     try:
         data = yt.get_playlist(playlistId=playlist_id, limit=None)
@@ -75,44 +210,61 @@ def _get_playlist_tracks(yt, playlist_id):
     tracks = data.get('tracks') or []
     return tracks, data.get('title') or f"playlist_{playlist_id}"
 
+def _track_rows(tracks):
+    """
+    Yield (title, artists, media_id) rows for csv.writer.writerows.
+    A playlist's tracks share one schema, so the title and ID keys are
+    picked once from the first track.
+    """
+    it = iter(tracks)
+    first = next(it, None)
+    if first is None:
+        return
+    title_key = 'title' if 'title' in first else 'name'
+    id_key = next((k for k in ('videoId', 'video_id', 'id') if k in first), 'videoId')
+    for t in chain((first,), it):
+        arts = t.get('artists') or ()
+        artists = ', '.join(a['name'] for a in arts if a.get('name'))
+        yield (t.get(title_key) or '', artists, t.get(id_key) or '')
+
 def _write_csv(out_path, tracks):
+    """
+    Write tracks (any iterable of track dicts) to out_path.
+    Rows are streamed through a 1 MiB buffer rather than flushed in small chunks.
+    """
     try:
-        with open(out_path, 'w', encoding='utf-8', newline='') as f:
+        with open(out_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(['Title', 'Artists', 'MediaId'])
-            for t in tracks:
-                title = t.get('title') or t.get('name') or ''
-                artists = ''
-                if t.get('artists'):
-                    artists = ', '.join([a.get('name') for a in t.get('artists') if a.get('name')])
-                media_id = t.get('videoId') or t.get('video_id') or t.get('id') or ''
-                writer.writerow([title, artists, media_id])
+            writer.writerows(_track_rows(tracks))
         return True
     except Exception as e:
         print(f"ERROR writing CSV {out_path}: {e}")
         return False
 
-def export_by_name(yt, name, out_dir):
+def export_by_name(yt, name, out_dir, refresh_library=False):
     try:
-        pls = yt.get_library_playlists(limit=None) or []
+        pl, from_cache, count = _lookup_playlist(yt, name, refresh=refresh_library)
+        tracks = title = None
+        if pl:
+            tracks, title = _get_playlist_tracks(yt, pl.get('playlistId'))
+        if from_cache and pl and (tracks is None or _norm_title(title) != _norm_title(pl.get('title'))):
+            # The cached ID was deleted, recreated or renamed since the
+            # listing was cached
+            print("Cached playlist list is out of date; fetching it again")
+            pl, _, count = _lookup_playlist(yt, name, refresh=True)
+            if pl:
+                tracks, title = _get_playlist_tracks(yt, pl.get('playlistId'))
     except Exception as e:
         print(f"ERROR listing playlists: {e}")
         return False
 
-    target = (name or '').strip().casefold()
-    matches = [pl for pl in pls if (pl.get('title') or '').strip().casefold() == target]
-    if not matches:
-        matches = [pl for pl in pls if target in (pl.get('title') or '').strip().casefold()]
-
-    if not matches:
+    if not pl:
         print(f"Playlist not found: {name}")
         return False
 
-    pl = matches[0]
-    if len(matches) > 1:
+    if count > 1:
         print(f"Multiple matches found; exporting first match: {pl.get('title')}")
-    pid = pl.get('playlistId')
-    tracks, title = _get_playlist_tracks(yt, pid)
     if tracks is None:
         return False
     fname = _sanitize_filename(title) + '.csv'
@@ -123,7 +275,14 @@ def export_by_name(yt, name, out_dir):
         print(f"Exported '{title}' -> {out_path}")
     return ok
 
-def export_all(yt, out_dir):
+def export_all(yt, out_dir, concurrency=8):
+    """
+    Export every library playlist to out_dir.
+    Playlist fetches are network-bound, so up to `concurrency` of them run
+    in parallel while CSVs are written on the calling thread as fetches
+    complete. At most `concurrency + 4` playlists are held in memory at
+    once, so a slow disk applies backpressure to the fetchers.
+    """
     try:
         pls = yt.get_library_playlists(limit=None) or []
     except Exception as e:
@@ -131,23 +290,43 @@ def export_all(yt, out_dir):
         return False
     os.makedirs(out_dir, exist_ok=True)
     succeeded = 0
-    for pl in pls:
-        pid = pl.get('playlistId')
-        title = pl.get('title') or pid
-        tracks, _ = _get_playlist_tracks(yt, pid)
-        if tracks is None:
-            print(f"  - Skipped '{title}' (fetch error)")
-            continue
-        fname = _sanitize_filename(title) + '.csv'
-        out_path = os.path.join(out_dir, fname)
-        if _write_csv(out_path, tracks):
-            succeeded += 1
-            print(f"  ✓ {title} -> {out_path}")
-        else:
-            print(f"  ✗ Failed to export: {title}")
+    workers = max(1, concurrency)
+    max_pending = workers + 4
+    remaining = iter(pls)
+    pending = {}
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        while True:
+            for pl in islice(remaining, max_pending - len(pending)):
+                pid = pl.get('playlistId')
+                pending[ex.submit(_get_playlist_tracks, yt, pid)] = pl.get('title') or pid
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                title = pending.pop(fut)
+                tracks, _ = fut.result()
+                if tracks is None:
+                    print(f"  - Skipped '{title}' (fetch error)")
+                    continue
+                fname = _sanitize_filename(title) + '.csv'
+                out_path = os.path.join(out_dir, fname)
+                if _write_csv(out_path, tracks):
+                    succeeded += 1
+                    print(f"  ✓ {title} -> {out_path}")
+                else:
+                    print(f"  ✗ Failed to export: {title}")
     print(f"Exported {succeeded}/{len(pls)} playlists to {out_dir}")
     return True
 
+# Header names ytmusicapi expects, keyed by their lowercased form
+_AUTH_HEADER_NAMES = {
+    'user-agent': 'User-Agent',
+    'cookie': 'Cookie',
+    'x-goog-authuser': 'X-Goog-AuthUser',
+    'authorization': 'Authorization',
+    'x-goog-visitor-id': 'X-Goog-Visitor-Id',
+}
+
 def setup_authentication():
     """
     Interactive setup: paste the request headers copied from DevTools (Copy → Copy request headers).
@@ -163,21 +342,15 @@ def setup_authentication():
     print("4. Right-click → Copy → Copy Request Headers")
     print("\nPaste the request headers below (Ctrl+D (Unix) / Ctrl+Z (Windows) to finish) then Enter:\n")
 
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
-
-    raw_headers = '\n'.join(lines)
+    # Read the whole paste in one call; it ends at EOF (Ctrl+D / Ctrl+Z)
+    raw_headers = sys.stdin.read()
     if not raw_headers.strip():
         print("No headers pasted, aborting.")
         return False
 
     headers = {}
     current_header = None
+    cookie_parts = []  # Cookie value and its continuation lines, joined once
 
     for line in raw_headers.splitlines():
         line = line.strip()
@@ -188,22 +361,15 @@ def setup_authentication():
             key = key.strip()
             value = value.strip()
             lk = key.lower()
-            if lk == 'user-agent':
-                headers['User-Agent'] = value
-            elif lk == 'cookie':
-                headers['Cookie'] = value
-            elif lk == 'x-goog-authuser':
-                headers['X-Goog-AuthUser'] = value
-            elif lk == 'authorization':
-                headers['Authorization'] = value
-            elif lk == 'x-goog-visitor-id':
-                headers['X-Goog-Visitor-Id'] = value
-            else:
-                headers[key] = value
+            headers[_AUTH_HEADER_NAMES.get(lk, key)] = value
+            if lk == 'cookie':
+                cookie_parts = [value]
             current_header = lk
         elif current_header and line:
             if current_header == 'cookie':
-                headers['Cookie'] = headers.get('Cookie', '') + ' ' + line
+                cookie_parts.append(line)
+    if cookie_parts:
+        headers['Cookie'] = ' '.join(cookie_parts)
 
     if not headers.get('Cookie') or 'SAPISID' not in headers.get('Cookie', ''):
         print("\n❌ ERROR: Could not find required cookies (SAPISID) in pasted headers.")
@@ -215,8 +381,7 @@ def setup_authentication():
         headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 
     try:
-        with open('browser.json', 'w', encoding='utf-8') as f:
-            json.dump(headers, f, indent=2)
+        _write_json('browser.json', headers, indent=True)
         print("\n✓ Authentication saved to browser.json")
         return True
     except Exception as e:
@@ -229,7 +394,9 @@ def main():
     group.add_argument('--name', help='Export playlist by name (case-insensitive)')
     group.add_argument('--all', action='store_true', help='Export all playlists')
     parser.add_argument('--out', default='.', help='Output directory (default: current directory)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Playlists to fetch in parallel with --all (default: 8)')
     parser.add_argument('--setup', action='store_true', help='Run interactive authentication setup (creates browser.json)')
+    parser.add_argument('--refresh-library', action='store_true', help='Re-fetch the library playlist list instead of using the cached copy (used with --name)')
 
     args = parser.parse_args()
 
@@ -247,17 +414,17 @@ def main():
 
     _ensure_browser_json()
     try:
-        yt = YTMusic('browser.json')
+        yt = YTMusic('browser.json', requests_session=_build_session(pool_size=max(1, args.concurrency)))
     except Exception as e:
         print(f"ERROR initializing YTMusic client: {e}")
         print("Run this script with --setup or run: ytmusicapi browser")
         sys.exit(1)
 
     if args.all:
-        ok = export_all(yt, args.out)
+        ok = export_all(yt, args.out, concurrency=args.concurrency)
         sys.exit(0 if ok else 2)
     else:
-        ok = export_by_name(yt, args.name, args.out)
+        ok = export_by_name(yt, args.name, args.out, refresh_library=args.refresh_library)
         sys.exit(0 if ok else 2)
 
 if __name__ == '__main__':
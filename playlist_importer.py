@@ -1,15 +1,35 @@
+import atexit
+import contextvars
 import csv
+import hashlib
 import json
 import os
+import random
 import sys
 import time
 import re
 import logging
+import logging.handlers
+import queue
+import threading
 import urllib.error
-from functools import wraps
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache, partial, wraps
+from itertools import chain
+from operator import itemgetter
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ytmusicapi import YTMusic
 from difflib import SequenceMatcher
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Security warning
 SECURITY_WARNING = """
 ⚠️  SECURITY WARNING ⚠️
@@ -23,13 +43,97 @@ Treat it like a password:
 # In-memory cache for search queries within a run
 SEARCH_CACHE = {}
 
+# Found video IDs are also kept on disk so re-runs skip repeat searches
+SEARCH_CACHE_FILE = '.yt_search_cache.json'
+SEARCH_CACHE_FLUSH_EVERY = 50
+SEARCH_CACHE_TTL_DAYS = 90  # entries older than this are searched again
+_search_cache_path = None  # set by load_search_cache(); None disables saving
+_search_cache_unsaved = 0
+_search_cache_ts = {}  # query -> time the saved result was found
+_search_cache_lock = threading.Lock()
+
+# Library playlist titles -> IDs remembered between runs (see PlaylistIndex),
+# one file per account: playlists-<account key>.json. The exporter keeps its
+# library listing in the same directory.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'yt-playlist-importer')
+
+# Searches in flight at once, across every playlist being imported
+SEARCH_WORKERS = 10
+_search_slots = threading.BoundedSemaphore(SEARCH_WORKERS)
+
+# Playlists from one CSV file imported at the same time
+PLAYLIST_WORKERS = 4
+
+# Set by main() on Ctrl+C; imports running in pool threads never see the
+# KeyboardInterrupt, so they check this between searches and batches
+_import_stop = threading.Event()
+
+def _check_stop():
+    if _import_stop.is_set():
+        raise KeyboardInterrupt
+
+# Guards the shared existing-playlists index between concurrent imports
+_playlist_index_lock = threading.Lock()
+
+# Video ID in youtube.com/watch?v=... and youtu.be/... URLs
+_YT_ID_RE = re.compile(r'(?:v=|youtu\.be/)([a-zA-Z0-9_-]{11})')
+
+@dataclass
+class Song:
+    """
+    One track to import. video_id is None until known (from the CSV or a
+    search); row_num is the CSV row, or None for Spotify tracks.
+    __slots__ keeps large playlists much smaller than per-song dicts.
+    """
+    __slots__ = ('video_id', 'title', 'artists', 'search_needed', 'row_num')
+    video_id: Optional[str]
+    title: str
+    artists: str
+    search_needed: bool
+    row_num: Optional[int]
+
 # Setup logging
-def setup_logging(log_file='playlist_import.log'):
-    """Configure logging to both file and console."""
+_log_listener = None  # QueueListener writing records for setup_logging()
+
+# Playlist being imported by the current thread (or search task), so
+# concurrent imports can be told apart in the log
+_log_playlist = contextvars.ContextVar('log_playlist', default=None)
+
+class _PlaylistTagFilter(logging.Filter):
+    """Prefix records logged during import_playlist() with the playlist name."""
+    def filter(self, record):
+        name = _log_playlist.get()
+        if name:
+            msg = str(record.msg)
+            body = msg.lstrip('\n')
+            record.msg = f"{msg[:len(msg) - len(body)]}[{name}] {body}"
+        return True
+
+_playlist_tag_filter = _PlaylistTagFilter()
+
+def _stop_log_listener():
+    """Flush queued log records and stop the listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for h in _log_listener.handlers:
+            h.close()
+        _log_listener = None
+
+def setup_logging(log_file='playlist_import.log', queued=True):
+    """
+    Configure logging to both file and console.
+    With queued=True, records are handed to a background QueueListener so
+    callers (including search/import threads) never wait on file or
+    console writes. Worker processes pass queued=False: they exit without
+    running atexit hooks, which would drop queued records.
+    """
     logger = logging.getLogger(__name__)
     logger.setLevel(logging.INFO)
+    logger.addFilter(_playlist_tag_filter)  # no-op if already added
 
     # Remove existing handlers to avoid duplicates when reinitializing
+    _stop_log_listener()
     if logger.handlers:
         for h in list(logger.handlers):
             logger.removeHandler(h)
@@ -45,17 +149,65 @@ def setup_logging(log_file='playlist_import.log'):
     fh.setFormatter(fmt)
     ch.setFormatter(fmt)
 
-    logger.addHandler(fh)
-    logger.addHandler(ch)
+    if queued:
+        global _log_listener
+        q = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(q, fh, ch, respect_handler_level=True)
+        _log_listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(q))
+    else:
+        logger.addHandler(fh)
+        logger.addHandler(ch)
     return logger
 
+atexit.register(_stop_log_listener)
+
 # initialize default logger (can be reinitialized in main with a different file)
 logger = setup_logging()
 
+def _read_json(path):
+    """Load a JSON file, using orjson's faster parser when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path, obj, indent=False):
+    """Write obj as UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2 if indent else None)
+
+# ytmusicapi reports HTTP errors as e.g. "Server returned HTTP 503: ..."
+_HTTP_5XX_RE = re.compile(r'\bHTTP 5\d\d\b')
+
+def _is_retryable(e):
+    """True for timeouts, connection failures and HTTP 5xx responses."""
+    if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                      urllib.error.URLError, ConnectionError, TimeoutError)):
+        return True
+    status = getattr(getattr(e, 'response', None), 'status_code', None) or 0
+    if status >= 500:
+        return True
+    error_str = str(e)
+    lowered = error_str.lower()
+    return (
+        'timeout' in lowered or
+        'timed out' in lowered or
+        'connection' in lowered or
+        'network' in lowered or
+        _HTTP_5XX_RE.search(error_str) is not None
+    )
+
 def retry_on_failure(max_attempts=3, backoff=2):
     """
-    Retry decorator for network calls with exponential backoff.
+    Retry decorator for network calls with jittered exponential backoff.
     Retries on requests exceptions, timeouts, connection errors and HTTP 5xx responses.
+    The jitter keeps parallel workers from retrying in lockstep.
     """
     def decorator(func):
         @wraps(func)
@@ -64,29 +216,81 @@ def retry_on_failure(max_attempts=3, backoff=2):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    error_str = str(e).lower()
-                    error_type = type(e).__name__.lower()
-                    
-                    # Check for retryable conditions
-                    retryable = (
-                        'timeout' in error_str or
-                        'connection' in error_str or
-                        'network' in error_str or
-                        '5' in error_str or
-                        hasattr(e, 'response') and getattr(e.response, 'status_code', 0) >= 500
-                    )
-
-                    if not retryable or attempt == max_attempts:
+                    if not _is_retryable(e) or attempt == max_attempts:
                         # final attempt or non-retryable -> raise
                         raise
 
-                    wait = backoff ** (attempt - 1)
-                    logger.info(f"    Retry {attempt}/{max_attempts} after {wait}s... ({type(e).__name__})")
+                    wait = backoff ** (attempt - 1) * random.uniform(0.5, 1.5)
+                    logger.info(f"    Retry {attempt}/{max_attempts} after {wait:.1f}s... ({type(e).__name__})")
                     time.sleep(wait)
             return None
         return wrapper
     return decorator
 
+# ytmusicapi applies this itself only to sessions it creates
+HTTP_TIMEOUT = 30
+
+class _Retry(Retry):
+    """
+    HTTP-level retry that re-sends POSTs only after a 429.
+    Every ytmusicapi call is a POST, including create_playlist: a 5xx or a
+    read timeout may come after the server already acted on it, and a
+    retry would then create a second playlist.
+    """
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method and method.upper() == 'POST':
+            return status_code == 429 and bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+def _build_session(pool_size=SEARCH_WORKERS):
+    """
+    Create a keep-alive HTTP session for YTMusic so every call reuses pooled
+    connections instead of paying a new TCP/TLS handshake. Rate-limit
+    responses (and GET server errors) are retried at the HTTP layer with
+    backoff; other failures are left to retry_on_failure.
+    Every request gets HTTP_TIMEOUT unless it passes its own.
+    pool_size should cover every thread sharing the session.
+    """
+    session = requests.Session()
+    session.request = partial(session.request, timeout=HTTP_TIMEOUT)
+    retry = _Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+_SAPISID_RE = re.compile(r'(?:^|;)\s*SAPISID=([^;]*)')
+
+def _account_key(auth_file='browser.json'):
+    """
+    Short hash of the login in auth_file (SAPISID cookie and
+    X-Goog-AuthUser), so data cached for one account is never used for
+    another. Logging in again just starts a fresh cache.
+    """
+    try:
+        headers = _read_json(auth_file)
+    except Exception:
+        return 'default'
+    cookie = headers.get('Cookie') or headers.get('cookie') or ''
+    m = _SAPISID_RE.search(cookie)
+    user = headers.get('X-Goog-AuthUser') or headers.get('x-goog-authuser') or '0'
+    login = f"{m.group(1) if m else cookie}\0{user}"
+    return hashlib.sha256(login.encode('utf-8')).hexdigest()[:16]
+
+# Header names ytmusicapi expects, keyed by their lowercased form
+_AUTH_HEADER_NAMES = {
+    'user-agent': 'User-Agent',
+    'cookie': 'Cookie',
+    'x-goog-authuser': 'X-Goog-AuthUser',
+    'authorization': 'Authorization',
+    'x-goog-visitor-id': 'X-Goog-Visitor-Id',
+}
+
 def setup_authentication():
     """
     Interactive setup for YouTube Music authentication.
@@ -106,19 +310,13 @@ def setup_authentication():
     print("\nPaste the request headers below:")
     print("(Press Ctrl+D (Unix) or Ctrl+Z (Windows) when done then Enter)\n")
     
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
-    
-    raw_headers = '\n'.join(lines)
+    # Read the whole paste in one call; it ends at EOF (Ctrl+D / Ctrl+Z)
+    raw_headers = sys.stdin.read()
     
     # Parse raw request headers format
     headers = {}
     current_header = None
+    cookie_parts = []  # Cookie value and its continuation lines, joined once
     
     for line in raw_headers.split('\n'):
         line = line.strip()
@@ -130,24 +328,22 @@ def setup_authentication():
             key, value = line.split(':', 1)
             key = key.strip()
             value = value.strip()
+            lk = key.lower()
             
             # Map header names to what ytmusicapi expects
-            if key.lower() == 'user-agent':
-                headers['User-Agent'] = value
-            elif key.lower() == 'cookie':
-                headers['Cookie'] = value
-            elif key.lower() == 'x-goog-authuser':
-                headers['X-Goog-AuthUser'] = value
-            elif key.lower() == 'authorization':
-                headers['Authorization'] = value
-            elif key.lower() == 'x-goog-visitor-id':
-                headers['X-Goog-Visitor-Id'] = value
+            name = _AUTH_HEADER_NAMES.get(lk)
+            if name:
+                headers[name] = value
+            if lk == 'cookie':
+                cookie_parts = [value]
             
-            current_header = key
+            current_header = lk
         elif current_header and line:
             # Continuation of previous header (multi-line)
-            if current_header.lower() == 'cookie':
-                headers['Cookie'] += ' ' + line
+            if current_header == 'cookie':
+                cookie_parts.append(line)
+    if cookie_parts:
+        headers['Cookie'] = ' '.join(cookie_parts)
     
     # Validate we have the required headers
     if not headers.get('Cookie') or 'SAPISID' not in headers.get('Cookie', ''):
@@ -161,21 +357,104 @@ def setup_authentication():
         headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     
     # Save to browser.json
-    with open('browser.json', 'w') as f:
-        json.dump(headers, f, indent=2)
+    _write_json('browser.json', headers, indent=True)
     
     print("\n✓ Authentication saved to browser.json")
     print(f"✓ Found {len(headers)} headers")
     return True
 
+def load_search_cache(path=SEARCH_CACHE_FILE):
+    """
+    Load search results saved by previous runs into SEARCH_CACHE and
+    enable saving new results back to `path` (every
+    SEARCH_CACHE_FLUSH_EVERY new hits and at exit).
+    Entries older than SEARCH_CACHE_TTL_DAYS are dropped.
+    """
+    global _search_cache_path, _search_cache_unsaved
+    _search_cache_path = path
+    atexit.register(save_search_cache)
+    if not os.path.exists(path):
+        return 0
+    try:
+        saved = _read_json(path)
+        if not isinstance(saved, dict):
+            raise ValueError("expected a JSON object")
+    except Exception as e:
+        logger.warning(f"Could not read search cache {path}: {e} (starting empty)")
+        return 0
+    now = time.time()
+    oldest = now - SEARCH_CACHE_TTL_DAYS * 86400
+    with _search_cache_lock:
+        for query, entry in saved.items():
+            # Flat "query": "videoId" entries predate timestamps; keep them as new
+            if isinstance(entry, str):
+                entry = {'vid': entry, 'ts': now}
+            if not isinstance(entry, dict) or not entry.get('vid'):
+                continue
+            ts = entry.get('ts') or 0
+            if ts < oldest:
+                _search_cache_unsaved += 1  # rewrite the file without it
+                continue
+            key = search_cache_key(query)
+            if key != query:
+                _search_cache_unsaved += 1  # saved before keys ignored case
+                if key in SEARCH_CACHE:
+                    continue
+            SEARCH_CACHE[key] = entry['vid']
+            _search_cache_ts[key] = ts
+        return len(SEARCH_CACHE)
+
+def _write_search_cache():
+    # Caller holds _search_cache_lock. Only hits are saved so songs that
+    # weren't found get searched again next run.
+    now = time.time()
+    hits = {
+        query: {'vid': vid, 'ts': _search_cache_ts.get(query, now)}
+        for query, vid in SEARCH_CACHE.items() if vid
+    }
+    tmp_path = _search_cache_path + '.tmp'
+    try:
+        _write_json(tmp_path, hits)
+        os.replace(tmp_path, _search_cache_path)
+    except Exception as e:
+        logger.warning(f"Could not save search cache {_search_cache_path}: {e}")
+
+def save_search_cache():
+    """Write SEARCH_CACHE to disk if load_search_cache() enabled it."""
+    global _search_cache_unsaved
+    with _search_cache_lock:
+        if _search_cache_path and _search_cache_unsaved:
+            _write_search_cache()
+            _search_cache_unsaved = 0
+
+def search_cache_key(query):
+    """SEARCH_CACHE key for a search query; case variants share one entry."""
+    return query.casefold()
+
+def cache_search_result(query, vid):
+    """Record a search result, flushing to disk every SEARCH_CACHE_FLUSH_EVERY new hits."""
+    global _search_cache_unsaved
+    with _search_cache_lock:
+        SEARCH_CACHE[query] = vid
+        if vid and _search_cache_path:
+            _search_cache_ts[query] = time.time()
+            _search_cache_unsaved += 1
+            if _search_cache_unsaved >= SEARCH_CACHE_FLUSH_EVERY:
+                _write_search_cache()
+                _search_cache_unsaved = 0
+
+_WS_RE = re.compile(r'\s+')
+
+@lru_cache(maxsize=8192)
 def normalize_for_search(title, artist):
     """
     Normalize title and artist for better search results.
     Collapses whitespace and formats query for YouTube Music.
+    Cached, since compilation CSVs repeat the same title/artist pairs.
     """
     # Collapse whitespace
-    title = ' '.join(title.split()) if title else ''
-    artist = ' '.join(artist.split()) if artist else ''
+    title = _WS_RE.sub(' ', title).strip() if title else ''
+    artist = _WS_RE.sub(' ', artist).strip() if artist else ''
     
     # Format: "Title" Artist for better matching
     if title and artist:
@@ -186,35 +465,72 @@ def normalize_for_search(title, artist):
         return artist
     return ''
 
-# Simple search option - works well for most cases
 @retry_on_failure()
+def _search_songs(yt, query, limit, max_throttled=5):
+    """
+    yt.search restricted to songs, retried on transient failures.
+    Paced by SEARCH_RATE_LIMITER and re-sent after rate-limit responses;
+    at most SEARCH_WORKERS searches run at once however many playlists
+    are importing.
+    """
+    for attempt in range(max_throttled + 1):
+        if not SEARCH_RATE_LIMITER.acquire(stop=_import_stop):
+            _check_stop()
+        try:
+            with _search_slots:
+                _check_stop()  # may have waited a while for the slot
+                results = yt.search(query, filter='songs', limit=limit)
+        except Exception as e:
+            if _is_rate_limited(str(e)) and attempt < max_throttled:
+                SEARCH_RATE_LIMITER.throttled()
+                continue
+            raise
+        SEARCH_RATE_LIMITER.success()
+        return results
+
+# Simple search option - works well for most cases
 def search_youtube_music_simple(yt, title, artist):
     """
     Simple search - just return first result.
     Kept for reference/rollback if advanced matching has issues.
+    Returns None if nothing matched; search errors are raised.
     """
     try:
         query = normalize_for_search(title, artist)
         if not query:
             return None
+        key = search_cache_key(query)
         
-        if query in SEARCH_CACHE:
-            return SEARCH_CACHE[query]
+        if key in SEARCH_CACHE:
+            return SEARCH_CACHE[key]
         
-        results = yt.search(query, filter='songs', limit=5)
+        results = _search_songs(yt, query, 5)
         if not results:
-            SEARCH_CACHE[query] = None
+            cache_search_result(key, None)
             return None
         
         vid = results[0].get('videoId')
-        SEARCH_CACHE[query] = vid
+        cache_search_result(key, vid)
         return vid
     except Exception as e:
         logger.warning(f"    Search error for '{title}' by '{artist}': {e}")
-        return None
+        raise
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+
+# Highest score search_youtube_music_advanced can give a result:
+# full title and artist scores (0.78 + 0.22), both boosts (0.12 + 0.08)
+# and the title+artist bonus (0.05)
+_PERFECT_SCORE = 1.25
+
+def _norm_text(s: str) -> str:
+    # lowercase, strip, remove non-alphanum (keep spaces), collapse whitespace
+    s = (s or '').casefold()
+    s = _NON_ALNUM_RE.sub(' ', s)
+    s = ' '.join(s.split())
+    return s
 
 # Added more advanced search option with scoring due to niche music matches
-@retry_on_failure()
 def search_youtube_music_advanced(yt, title, artist):
     """
     Search YouTube Music for a song by title and artist with improved matching.
@@ -224,41 +540,40 @@ def search_youtube_music_advanced(yt, title, artist):
     - Artist token overlap increases score.
     - Small boosts if normalized title/artist are substrings of the result.
     - Prefer results with a videoId and return the highest scoring candidate.
-    - Results are cached in-memory per normalized query.
+    - Results are cached per normalized query, ignoring case.
+    Returns None if nothing matched; search errors are raised so they
+    aren't mistaken for (or cached as) a miss.
     """
     try:
         query = normalize_for_search(title, artist)
         if not query:
             return None
+        key = search_cache_key(query)
 
         # Cache lookup
-        if query in SEARCH_CACHE:
-            return SEARCH_CACHE[query]
+        if key in SEARCH_CACHE:
+            return SEARCH_CACHE[key]
 
         # Ask for more results to have better candidates
-        results = yt.search(query, filter='songs', limit=10)
+        results = _search_songs(yt, query, 10)
         if not results:
-            SEARCH_CACHE[query] = None
+            cache_search_result(key, None)
             return None
 
-        def norm_text(s: str) -> str:
-            # lowercase, strip, remove non-alphanum (keep spaces), collapse whitespace
-            s = (s or '').casefold()
-            s = re.sub(r'[^a-z0-9\s]', ' ', s)
-            s = ' '.join(s.split())
-            return s
-
-        norm_title = norm_text(title)
-        norm_artist = norm_text(artist)
+        norm_title = _norm_text(title)
+        norm_artist = _norm_text(artist)
+        t_tokens = set(norm_artist.split())
 
         best = None
         best_score = -1.0
 
         for r in results:
             r_title = r.get('title') or ''
-            r_artists = ' '.join((a.get('name') for a in r.get('artists', []) if a.get('name')))
-            r_title_n = norm_text(r_title)
-            r_artists_n = norm_text(r_artists)
+            r_title_n = _norm_text(r_title)
+            # Result artists only matter when there is an artist to compare
+            r_artists_n = ''
+            if norm_artist:
+                r_artists_n = _norm_text(' '.join((a.get('name') for a in r.get('artists', []) if a.get('name'))))
 
             # Title similarity (primary)
             title_score = SequenceMatcher(None, norm_title, r_title_n).ratio() if norm_title else 0.0
@@ -266,7 +581,6 @@ def search_youtube_music_advanced(yt, title, artist):
             # Artist overlap (token intersection / max token count)
             artist_score = 0.0
             if norm_artist:
-                t_tokens = set(norm_artist.split())
                 a_tokens = set(r_artists_n.split())
                 if t_tokens and a_tokens:
                     artist_score = len(t_tokens & a_tokens) / max(len(t_tokens), len(a_tokens))
@@ -292,19 +606,23 @@ def search_youtube_music_advanced(yt, title, artist):
             if score > best_score:
                 best_score = score
                 best = r
+                # Exact title and artist match; later results can only tie
+                if best_score >= _PERFECT_SCORE - 1e-9:
+                    break
 
         if best:
             vid = best.get('videoId')
-            SEARCH_CACHE[query] = vid
-            logger.info(f"    Best match: {best.get('title')} - {', '.join((a.get('name') for a in best.get('artists', []) if a.get('name')))} (score={best_score:.2f})")
+            cache_search_result(key, vid)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"    Best match: {best.get('title')} - {', '.join((a.get('name') for a in best.get('artists', []) if a.get('name')))} (score={best_score:.2f})")
             return vid
 
-        SEARCH_CACHE[query] = None
+        cache_search_result(key, None)
         return None
 
     except Exception as e:
         logger.warning(f"    Search error for '{title}' by '{artist}': {e}")
-        return None
+        raise
     
 # Choose the search to use:
 # Use the advanced version
@@ -336,23 +654,22 @@ def parse_spotify_playlist(url):
         return None
 
     try:
-        # Fetch playlist metadata
-        playlist_meta = sp.playlist(playlist_id)
+        # Fetch playlist metadata (tracks are paged separately below)
+        playlist_meta = sp.playlist(playlist_id, fields='name,description')
     except Exception as e:
         logger.error(f"ERROR fetching Spotify playlist metadata: {e}")
         return None
 
     songs = []
     try:
-        # Fetch all playlist items (handle pagination)
-        items = []
-        resp = sp.playlist_items(playlist_id, limit=100)
-        while resp:
-            items.extend(resp.get('items', []))
-            if resp.get('next'):
-                resp = sp.next(resp)
-            else:
-                break
+        # Fetch all playlist items. The first page gives the total, then the
+        # remaining pages are requested concurrently (results stay in order).
+        first = sp.playlist_items(playlist_id, limit=100)
+        page_size = first.get('limit') or 100
+        offsets = range(page_size, first.get('total') or 0, page_size)
+        with ThreadPoolExecutor(max_workers=5) as ex:
+            rest = list(ex.map(lambda offset: sp.playlist_items(playlist_id, limit=page_size, offset=offset), offsets))
+        items = list(chain.from_iterable(page.get('items') or [] for page in [first] + rest))
 
         for item in items:
             track = item.get('track')
@@ -363,14 +680,10 @@ def parse_spotify_playlist(url):
 
             title = track.get('name') or ''
             # join artist names safely
-            artists = ', '.join([a.get('name') for a in track.get('artists', []) if a.get('name')]) if track.get('artists') else ''
+            arts = track.get('artists') or ()
+            artists = ', '.join(a['name'] for a in arts if a.get('name'))
             # If there's an explicit external URL/id you could try to map it, but we fallback to search
-            songs.append({
-                'title': title,
-                'artists': artists,
-                'videoId': None,
-                'search_needed': bool(title),
-            })
+            songs.append(Song(None, title, artists, bool(title), None))
 
         return {
             'name': playlist_meta.get('name', f"spotify_{playlist_id}"),
@@ -382,101 +695,118 @@ def parse_spotify_playlist(url):
         logger.error(f"ERROR parsing Spotify playlist items: {e}")
         return None
 
-def import_playlist_from_csv(yt, csv_file):
+def iter_playlist_rows(csv_file):
     """
-    Import playlists from CSV file.
+    Stream a playlist CSV, yielding (playlist_name, description, song) for
+    each usable row. Rows that can't be used are logged and skipped.
     Supports multiple formats:
     - Kreate format: PlaylistBrowseId, PlaylistName, MediaId, Title, Artists, Duration, ThumbnailUrl
     - Simple format: Title, Artist (will search YouTube Music)
     - URL format: URL (extracts video ID)
     """
+    with open(csv_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        headers = next(reader, None) or []
+        
+        # Resolve column positions once. Every row gets an extra empty
+        # field at index `width` that missing columns point at, so one
+        # itemgetter call pulls all the fields a row needs.
+        width = len(headers)
+        col = {name: i for i, name in enumerate(headers)}
+        pick_fields = itemgetter(
+            col.get('PlaylistName', width),
+            col.get('Description', width),
+            col.get('Title', width),
+            col.get('Artists', width),
+            col.get('Artist', width),
+            col.get('MediaId', col.get('VideoId', width)),
+            col.get('URL', col.get('url', width)),
+        )
+        
+        # Validate CSV structure
+        has_mediaid = 'MediaId' in headers
+        has_playlistname = 'PlaylistName' in headers
+        has_url = 'URL' in headers or 'url' in headers
+        has_title = 'Title' in headers
+        
+        # Warn if missing essential columns
+        if not has_mediaid and not has_title and not has_url:
+            logger.warning("  ⚠ Warning: CSV missing Title, MediaId, or URL columns")
+        
+        # Determine playlist name
+        if has_playlistname:
+            default_playlist_name = None
+        else:
+            # Use filename as playlist name
+            default_playlist_name = os.path.splitext(os.path.basename(csv_file))[0]
+        
+        # filter() drops blank lines, as DictReader did
+        for row_num, row in enumerate(filter(None, reader), start=2):  # start=2 accounts for header row
+            try:
+                # Make the row exactly `width` fields plus the empty slot
+                if len(row) != width:
+                    row = row[:width] + [''] * (width - len(row))
+                row.append('')
+                playlist_name, description, title, artists, artist, video_id, url = pick_fields(row)
+                
+                # Get playlist name and normalize
+                if has_playlistname:
+                    playlist_name = playlist_name.strip()
+                else:
+                    playlist_name = default_playlist_name
+                
+                if not playlist_name:
+                    logger.warning(f"  ⚠ Row {row_num}: Skipping - no playlist name")
+                    continue
+                
+                # Get description if provided
+                description = description.strip()
+                title = title.strip()
+                artists = artists.strip() or artist.strip()
+                
+                # Get video ID (try multiple methods)
+                # Method 1: Direct MediaId/VideoId
+                video_id = video_id.strip() or None
+                
+                # Method 2: Parse from URL ('' when there is no URL column)
+                if not video_id and url:
+                    match = _YT_ID_RE.search(url)
+                    if match:
+                        video_id = match.group(1)
+                
+                # Method 3: Search by title/artist (fallback)
+                search_needed = not video_id and bool(title)
+                
+                if not video_id and not title:
+                    logger.warning(f"  ⚠ Row {row_num}: Skipping - no video ID or title")
+                    continue
+                
+                yield playlist_name, description, Song(video_id, title, artists, search_needed, row_num)
+                
+            except Exception as e:
+                logger.error(f"  ✗ Row {row_num}: Error parsing - {e}")
+                continue
+
+def import_playlist_from_csv(csv_file):
+    """
+    Import playlists from CSV file, grouping iter_playlist_rows() by
+    playlist name. The first row of each playlist sets its description.
+    Only reads the file, so it can run in a worker process.
+    """
     playlists = {}
+    total_songs = 0
     
     logger.info(f"\nReading CSV file: {csv_file}")
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames or []
-            
-            # Validate CSV structure
-            has_mediaid = 'MediaId' in headers
-            has_playlistname = 'PlaylistName' in headers
-            has_url = 'URL' in headers or 'url' in headers
-            has_title = 'Title' in headers
-            has_description = 'Description' in headers
-            
-            # Warn if missing essential columns
-            if not has_mediaid and not has_title and not has_url:
-                logger.warning("  ⚠ Warning: CSV missing Title, MediaId, or URL columns")
-            
-            # Determine playlist name
-            if has_playlistname:
-                default_playlist_name = None
-            else:
-                # Use filename as playlist name
-                default_playlist_name = os.path.splitext(os.path.basename(csv_file))[0]
-            
-            for row_num, row in enumerate(reader, start=2):  # start=2 accounts for header row
-                try:
-                    # Get playlist name and normalize
-                    if has_playlistname:
-                        playlist_name = (row.get('PlaylistName') or '').strip()
-                    else:
-                        playlist_name = default_playlist_name
-                    
-                    if not playlist_name:
-                        logger.warning(f"  ⚠ Row {row_num}: Skipping - no playlist name")
-                        continue
-                    
-                    # Get description if provided
-                    description = (row.get('Description') or '').strip() if has_description else ''
-                    
-                    # Get video ID (try multiple methods)
-                    video_id = None
-                    title = (row.get('Title') or '').strip()
-                    artists = (row.get('Artists') or row.get('Artist') or '').strip()
-                    
-                    # Method 1: Direct MediaId/VideoId
-                    if has_mediaid:
-                        video_id = (row.get('MediaId') or '').strip()
-                    elif 'VideoId' in headers:
-                        video_id = (row.get('VideoId') or '').strip()
-                    
-                    # Method 2: Parse from URL
-                    if not video_id and has_url:
-                        url = row.get('URL', '') or row.get('url', '')
-                        if url:
-                            # Extract video ID from YouTube URL
-                            match = re.search(r'(?:v=|youtu\.be/)([a-zA-Z0-9_-]{11})', url)
-                            if match:
-                                video_id = match.group(1)
-                    
-                    # Method 3: Search by title/artist (fallback)
-                    search_needed = not video_id and title
-                    
-                    if not video_id and not title:
-                        logger.warning(f"  ⚠ Row {row_num}: Skipping - no video ID or title")
-                        continue
-                    
-                    if playlist_name not in playlists:
-                        playlists[playlist_name] = {
-                            'songs': [],
-                            'description': description
-                        }
-                    
-                    playlists[playlist_name]['songs'].append({
-                        'videoId': video_id,
-                        'title': title,
-                        'artists': artists,
-                        'search_needed': search_needed,
-                        'row_num': row_num
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"  ✗ Row {row_num}: Error parsing - {e}")
-                    continue
+        for playlist_name, description, song in iter_playlist_rows(csv_file):
+            if playlist_name not in playlists:
+                playlists[playlist_name] = {
+                    'songs': [],
+                    'description': description
+                }
+            playlists[playlist_name]['songs'].append(song)
+            total_songs += 1
         
-        total_songs = sum(len(p['songs']) for p in playlists.values())
         logger.info(f"✓ Found {len(playlists)} playlist(s) with {total_songs} total songs")
         return playlists
     
@@ -495,143 +825,470 @@ def add_songs_batch(yt, playlist_id, video_ids):
         duplicates=False
     )
 
-def import_playlist(yt, playlist_name, playlist_data, append=True, privacy='PRIVATE'):
+def _init_worker_logging(log_file):
+    """ProcessPoolExecutor initializer: log to the same file as the main process."""
+    global logger
+    logger = setup_logging(log_file, queued=False)
+
+def parse_csv_files(csv_files, log_file):
+    """
+    Parse CSV files into playlists, in parallel worker processes when there
+    is more than one file. Returns a list of results in csv_files order.
+    """
+    if len(csv_files) < 2:
+        return [import_playlist_from_csv(f) for f in csv_files]
+    workers = min(len(csv_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_logging, initargs=(log_file,)) as ex:
+        return list(ex.map(import_playlist_from_csv, csv_files))
+
+class TokenBucket:
+    """
+    Adaptive rate limiter for YouTube Music requests.
+
+    acquire() blocks until a request may be sent, allowing bursts of up to
+    `burst` requests at `rate` per second, and returns False instead if the
+    optional `stop` event gets set while it waits. throttled() halves the rate and
+    backs off after a rate-limit response; after `recover_after` straight
+    successes the rate grows by 1.5x again, up to the starting rate.
+    """
+    def __init__(self, rate=4.0, burst=8, recover_after=10, min_rate=0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.recover_after = recover_after
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.successes = 0
+        self.consecutive_429s = 0
+        self.throttle_count = 0  # total rate-limit responses seen
+        self.lock = threading.Lock()
+
+    def acquire(self, stop=None):
+        while True:
+            if stop is not None and stop.is_set():
+                return False
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def success(self):
+        with self.lock:
+            self.consecutive_429s = 0
+            if self.rate < self.max_rate:
+                self.successes += 1
+                if self.successes >= self.recover_after:
+                    self.rate = min(self.max_rate, self.rate * 1.5)
+                    self.successes = 0
+
+    def throttled(self):
+        with self.lock:
+            self.consecutive_429s += 1
+            self.throttle_count += 1
+            self.successes = 0
+            self.tokens = 0.0
+            self.rate = max(self.min_rate, self.rate * 0.5)
+            wait = min(30, 2 ** self.consecutive_429s)
+            rate = self.rate
+        logger.warning(f"    Rate limited, slowing to {rate:.2f} requests/s (waiting {wait}s)")
+        time.sleep(wait)
+
+# Shared by every playlist edit / search in the run; YouTube rate-limits
+# per account
+ADD_RATE_LIMITER = TokenBucket()
+SEARCH_RATE_LIMITER = TokenBucket(rate=10.0, burst=SEARCH_WORKERS)
+
+def _is_rate_limited(error_msg):
+    return '429' in error_msg or 'too many requests' in error_msg.lower()
+
+def _try_add(yt, playlist_id, video_ids, max_throttled=5):
+    """
+    Send one add_playlist_items request, paced by ADD_RATE_LIMITER and
+    re-sent after rate-limit responses.
+    Returns ('added' | 'skipped' | 'failed', error message).
+    """
+    for attempt in range(max_throttled + 1):
+        ADD_RATE_LIMITER.acquire()
+        try:
+            result = add_songs_batch(yt, playlist_id, video_ids)
+        except Exception as e:
+            error_msg = str(e)
+            if _is_rate_limited(error_msg) and attempt < max_throttled:
+                ADD_RATE_LIMITER.throttled()
+                continue
+            # Check for success reported as error (ytmusicapi quirk)
+            if 'STATUS_SUCCEEDED' in error_msg:
+                return 'added', ''
+            # Check if songs already in playlist
+            if 'already' in error_msg.lower() or 'duplicate' in error_msg.lower():
+                return 'skipped', error_msg
+            return 'failed', error_msg
+        ADD_RATE_LIMITER.success()
+        break
+
+    if isinstance(result, dict) and 'SUCCEEDED' in str(result.get('status', '')):
+        return 'added', ''
+    error_msg = str(result)
+    if 'already' in error_msg.lower() or 'duplicate' in error_msg.lower():
+        return 'skipped', error_msg
+    return 'failed', f"Add rejected: {error_msg[:200]}"
+
+def add_songs_with_fallback(yt, playlist_id, video_ids):
+    """
+    Add songs in a single request, falling back to one request per song
+    only when the batch is rejected, so one duplicate or unavailable video
+    doesn't take the rest of the batch down with it.
+    Returns (added, skipped, {video_id: error}, whole) where whole is True
+    if the batch went through in its single request.
+    """
+    status, error_msg = _try_add(yt, playlist_id, video_ids)
+    if status == 'added':
+        return len(video_ids), 0, {}, True
+    if len(video_ids) == 1:
+        if status == 'skipped':
+            return 0, 1, {}, False
+        return 0, 0, {video_ids[0]: error_msg}, False
+
+    added = skipped = 0
+    errors = {}
+    for vid in video_ids:
+        status, error_msg = _try_add(yt, playlist_id, [vid])
+        if status == 'added':
+            added += 1
+        elif status == 'skipped':
+            skipped += 1
+        else:
+            errors[vid] = error_msg
+    return added, skipped, errors, False
+
+def _song_query(song):
+    """SEARCH_CACHE key of the search for a song."""
+    return search_cache_key(normalize_for_search(song.title, song.artists))
+
+def _resolve_ids(yt, songs, concurrency=SEARCH_WORKERS):
+    """
+    Fill in missing video IDs by searching YouTube Music.
+    Searches are independent network round-trips, so up to `concurrency`
+    are queued in parallel (_search_songs caps them across playlists).
+    Songs with the same normalized query share one search.
+    Returns (number of songs searched, {query: error} for failed searches).
+
+    Workers share the one YTMusic client. Each call rewrites the
+    authorization entry of the client's cached headers dict in place; that
+    is harmless only because the dict's keys don't change after the first
+    call, so concurrent calls never resize it. Requests go through a
+    thread-safe pooled requests.Session, and SEARCH_CACHE writes are
+    serialized by cache_search_result().
+    """
+    pending = [s for s in songs if not s.video_id and s.search_needed]
+    if not pending:
+        return 0, {}
+
+    by_query = {}
+    for song in pending:
+        by_query.setdefault(_song_query(song), []).append(song)
+
+    log_searches = logger.isEnabledFor(logging.INFO)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
+        futures = {}
+        errors = {}
+        try:
+            for query, group in by_query.items():
+                song = group[0]
+                if log_searches:
+                    row_info = f" (Row {song.row_num})" if song.row_num else ""
+                    logger.info(f"  Searching{row_info}: {song.title} - {song.artists}")
+                # Each task runs in a copy of this context so its log lines
+                # carry the playlist name too
+                ctx = contextvars.copy_context()
+                futures[ex.submit(ctx.run, search_youtube_music, yt, song.title, song.artists)] = query
+            # Every search is queued (and logged) up front, so report how many
+            # have finished while the pool works through them
+            for done, fut in enumerate(as_completed(futures), 1):
+                _check_stop()
+                query = futures[fut]
+                try:
+                    vid = fut.result()
+                except Exception as e:
+                    vid = None
+                    errors[query] = f"Search failed: {e}"
+                for song in by_query[query]:
+                    song.video_id = vid
+                if done % 50 == 0 or done == len(futures):
+                    logger.info(f"  Search progress: {done}/{len(futures)} searches")
+        except BaseException:
+            # Ctrl+C or an error: drop the queued searches so leaving the
+            # pool only waits for the ones already running
+            for fut in futures:
+                fut.cancel()
+            raise
+    return len(pending), errors
+
+@retry_on_failure()
+def get_playlist_video_ids(yt, playlist_id):
+    """Set of video IDs already in a playlist."""
+    data = yt.get_playlist(playlist_id, limit=None) or {}
+    return {t['videoId'] for t in data.get('tracks') or [] if t.get('videoId')}
+
+def get_library_index(yt):
+    """Map casefolded library playlist titles to playlist IDs (first match wins)."""
+    index = {}
+    for pl in yt.get_library_playlists(limit=None) or []:
+        index.setdefault((pl.get('title') or '').strip().casefold(), pl.get('playlistId'))
+    return index
+
+class PlaylistIndex:
+    """
+    Casefolded library playlist titles -> playlist IDs, shared by the
+    imports of one run and saved to `path` (by default this account's file
+    in CACHE_DIR) for the next.
+
+    A title remembered from an earlier run is checked with a one-track
+    get_playlist() (it must still exist under that title), so re-imports
+    skip the full get_library_playlists() listing. Titles that aren't
+    remembered fall back to that listing, fetched at most once per run.
+    Callers serialize access (import_playlist holds _playlist_index_lock).
+    """
+    def __init__(self, yt, path=None):
+        if path is None:
+            path = os.path.join(CACHE_DIR, f"playlists-{_account_key()}.json")
+        self.yt = yt
+        self.path = path
+        self.library = None  # full listing, once fetched
+        self.checked = set()
+        self.saved = {}
+        if os.path.exists(path):
+            try:
+                saved = _read_json(path)
+                if isinstance(saved, dict):
+                    self.saved = saved
+            except Exception as e:
+                logger.warning(f"Could not read playlist map {path}: {e} (starting empty)")
+
+    def _still_valid(self, title, playlist_id):
+        try:
+            data = self.yt.get_playlist(playlist_id, limit=1) or {}
+        except Exception:
+            return False
+        return (data.get('title') or '').strip().casefold() == title
+
+    def get(self, title):
+        if title in self.checked:
+            return self.saved.get(title)
+        if self.library is None:
+            playlist_id = self.saved.get(title)
+            if playlist_id and self._still_valid(title, playlist_id):
+                self.checked.add(title)
+                return playlist_id
+            logger.info("  Checking for existing playlists...")
+            try:
+                self.library = get_library_index(self.yt)
+            except Exception as e:
+                logger.warning(f"  Warning: Could not check for existing playlists: {e}")
+                self.library = {}
+            else:
+                # The listing is authoritative; forget titles it doesn't have
+                for stale in [t for t in self.saved if t not in self.library and t not in self.checked]:
+                    del self.saved[stale]
+                self.saved.update(self.library)
+                self.checked.update(self.library)
+        return self.saved.get(title) if title in self.checked else None
+
+    def __setitem__(self, title, playlist_id):
+        self.saved[title] = playlist_id
+        self.checked.add(title)
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            _write_json(tmp_path, self.saved)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save playlist map {self.path}: {e}")
+
+def import_playlist(yt, playlist_name, playlist_data, append=True, privacy='PRIVATE', existing_playlists=None):
     """
     Import a single playlist to YouTube Music.
     If append=True and playlist exists, adds songs to existing playlist.
     If append=False, always creates a new playlist.
+    existing_playlists is an optional PlaylistIndex (or get_library_index()
+    dict) shared across imports; playlists created here are added to it.
+    Everything logged meanwhile is prefixed with the playlist name, since
+    several playlists may be importing at once.
     """
+    token = _log_playlist.set(playlist_name)
+    try:
+        return _import_playlist(yt, playlist_name, playlist_data, append, privacy, existing_playlists)
+    finally:
+        _log_playlist.reset(token)
+
+def _import_playlist(yt, playlist_name, playlist_data, append, privacy, existing_playlists):
     songs = playlist_data.get('songs', playlist_data) if isinstance(playlist_data, dict) else playlist_data
     description = playlist_data.get('description', '') if isinstance(playlist_data, dict) else ''
+    total = len(songs)
     
     logger.info('='*70)
-    logger.info(f"Processing: {playlist_name} ({len(songs)} songs)")
+    logger.info(f"Processing: {playlist_name} ({total} songs)")
     logger.info('='*70)
     
     try:
         playlist_id = None
+        appending = False
+        target_title = (playlist_name or '').strip().casefold()
         
-        # Check if playlist already exists (if append mode)
-        if append:
-            logger.info("  Checking for existing playlist...")
-            try:
-                existing_playlists = yt.get_library_playlists(limit=None)
-                for pl in existing_playlists:
-                    existing_title = (pl.get('title') or '').strip().casefold()
-                    target_title = (playlist_name or '').strip().casefold()
-                    if existing_title == target_title:
-                        playlist_id = pl.get('playlistId')
+        # Lookup and create happen under one lock so concurrent imports of
+        # the same title can't both create it
+        with _playlist_index_lock:
+            # Check if playlist already exists (if append mode)
+            if append:
+                if existing_playlists is None:
+                    logger.info("  Checking for existing playlist...")
+                    try:
+                        existing_playlists = get_library_index(yt)
+                    except Exception as e:
+                        logger.warning(f"  Warning: Could not check for existing playlists: {e}")
+                if existing_playlists:
+                    playlist_id = existing_playlists.get(target_title)
+                    if playlist_id:
+                        appending = True
                         logger.info(f"✓ Found existing playlist (ID: {playlist_id})")
                         logger.info(f"  Will append songs to existing playlist")
-                        break
-            except Exception as e:
-                logger.warning(f"  Warning: Could not check for existing playlists: {e}")
-        
-        # Create new playlist if doesn't exist
-        if not playlist_id:
-            # Only add auto-description if no description provided
-            if not description:
-                description = f"" # I would rather it's blank than auto-generated
             
-            playlist_id = yt.create_playlist(
-                title=playlist_name,
-                description=description,
-                privacy_status=privacy
-            )
-            logger.info(f"✓ Created new playlist (ID: {playlist_id}, Privacy: {privacy})")
+            # Create new playlist if doesn't exist
+            if not playlist_id:
+                # Only add auto-description if no description provided
+                if not description:
+                    description = f"" # I would rather it's blank than auto-generated
+                
+                playlist_id = yt.create_playlist(
+                    title=playlist_name,
+                    description=description,
+                    privacy_status=privacy
+                )
+                logger.info(f"✓ Created new playlist (ID: {playlist_id}, Privacy: {privacy})")
+                if existing_playlists is not None:
+                    existing_playlists[target_title] = playlist_id
         
         successful = 0
         failed = 0
-        searched = 0
         skipped = 0
+        # Only the first few failures are listed in the summary, so keep
+        # just those; `failed` has the full count
+        max_listed = 20
         failed_songs = []
         
-        # Batch processing
-        batch = []
-        batch_size = 20
+        # Songs an existing playlist already has are skipped here; with
+        # duplicates=False one of them gets a whole batch rejected and
+        # retried song by song
+        present = set()
+        if appending:
+            try:
+                present = get_playlist_video_ids(yt, playlist_id)
+            except Exception as e:
+                logger.warning(f"  Warning: Could not read existing playlist songs: {e}")
+        
+        # Resolve all missing video IDs up front so adds can run back-to-back
+        searched, search_errors = _resolve_ids(yt, songs)
         
-        for i, song in enumerate(songs, 1):
-            row_info = f" (Row {song.get('row_num')})" if song.get('row_num') else ""
+        video_ids = []
+        # videoId -> first song with it; maps add errors back and drops
+        # repeats (a MediaId row and a search can land on the same video)
+        by_vid = {}
+        for song in songs:
             try:
-                video_id = song['videoId']
+                video_id = song.video_id
                 
-                # If no video ID, search for it
-                if not video_id and song.get('search_needed'):
-                    logger.info(f"  Searching{row_info}: {song['title']} - {song['artists']}")
-                    video_id = search_youtube_music(yt, song['title'], song['artists'])
-                    searched += 1
-                    
-                    if not video_id:
-                        raise Exception("Song not found in search")
+                if not video_id and song.search_needed:
+                    raise Exception(search_errors.get(_song_query(song), "Song not found in search"))
                 
                 if not video_id:
                     raise Exception("No video ID available")
                 
-                # Add to batch
-                batch.append(video_id)
-                
-                # Process batch when full or at end
-                if len(batch) >= batch_size or i == len(songs):
-                    try:
-                        add_songs_batch(yt, playlist_id, batch)
-                        successful += len(batch)
-                        logger.info(f"  ✓ Added batch of {len(batch)} songs")
-                        batch = []
-                        time.sleep(1)  # Rate limiting between batches
-                    except Exception as e:
-                        error_msg = str(e)
-                        # Check for success reported as error (ytmusicapi quirk)
-                        if 'STATUS_SUCCEEDED' in error_msg:
-                            successful += len(batch)
-                        # Check if songs already in playlist
-                        elif 'already' in error_msg.lower() or 'duplicate' in error_msg.lower():
-                            skipped += len(batch)
-                        else:
-                            # Batch failed, log all songs in batch
-                            for vid in batch:
-                                failed += 1
-                                matching_song = next((s for s in songs if s.get('videoId') == vid), None)
-                                if matching_song:
-                                    failed_songs.append({
-                                        'row': matching_song.get('row_num', '?'),
-                                        'title': matching_song['title'],
-                                        'artists': matching_song['artists'],
-                                        'error': error_msg
-                                    })
-                        batch = []
+                if video_id in by_vid or video_id in present:
+                    skipped += 1
+                    continue
                 
-                # Progress indicator
-                if i % 25 == 0 or i == len(songs):
-                    status = f"  Progress: {i}/{len(songs)} songs"
-                    if searched > 0:
-                        status += f" ({searched} searched)"
-                    logger.info(status)
+                video_ids.append(video_id)
+                by_vid[video_id] = song
                 
             except Exception as e:
                 error_msg = str(e)
                 failed += 1
-                failed_songs.append({
-                    'row': song.get('row_num', '?'),
-                    'title': song['title'],
-                    'artists': song['artists'],
-                    'error': error_msg
-                })
-                logger.warning(f"  ✗{row_info}: {song['title']} - {error_msg}")
+                if len(failed_songs) < max_listed:
+                    failed_songs.append({
+                        'row': song.row_num or '?',
+                        'title': song.title,
+                        'artists': song.artists,
+                        'error': error_msg
+                    })
+                row_info = f" (Row {song.row_num})" if song.row_num else ""
+                logger.warning(f"  ✗{row_info}: {song.title} - {error_msg}")
+        
+        # Batch processing, paced by ADD_RATE_LIMITER. Batches grow while the
+        # API accepts them in one request and shrink when it rate limits.
+        # A rejected batch costs a request per song to recover, so it also
+        # halves the size and caps how far batches may grow again.
+        batch_size = 100
+        min_batch_size, max_batch_size = 25, 200
+        start = 0
+        while start < len(video_ids):
+            _check_stop()
+            batch = video_ids[start:start + batch_size]
+            start += len(batch)
+            throttled_before = ADD_RATE_LIMITER.throttle_count
+            added, dupes, errors, whole = add_songs_with_fallback(yt, playlist_id, batch)
+            if not whole and len(batch) > 1:
+                max_batch_size = max(min_batch_size, len(batch) // 2)
+                batch_size = max_batch_size
+            elif ADD_RATE_LIMITER.throttle_count > throttled_before:
+                batch_size = max(min_batch_size, batch_size // 2)
+            elif whole:
+                batch_size = min(max_batch_size, batch_size * 2)
+            successful += added
+            skipped += dupes
+            if added:
+                logger.info(f"  ✓ Added batch of {added} songs")
+            for vid, error_msg in errors.items():
+                failed += 1
+                matching_song = by_vid.get(vid)
+                if matching_song and len(failed_songs) < max_listed:
+                    failed_songs.append({
+                        'row': matching_song.row_num or '?',
+                        'title': matching_song.title,
+                        'artists': matching_song.artists,
+                        'error': error_msg
+                    })
+            
+            # Progress indicator
+            status = f"  Progress: {start}/{len(video_ids)} songs"
+            if searched > 0:
+                status += f" ({searched} searched)"
+            logger.info(status)
         
-        logger.info(f"\n✓ Completed '{playlist_name}'")
-        logger.info(f"  ✓ Successfully added: {successful}/{len(songs)} songs")
+        # The summary goes out as single records so other playlists'
+        # lines can't land in the middle of it
+        summary = [f"\n✓ Completed '{playlist_name}'",
+                   f"  ✓ Successfully added: {successful}/{total} songs"]
         if searched > 0:
-            logger.info(f"  🔍 Songs found by search: {searched}")
+            summary.append(f"  🔍 Songs found by search: {searched}")
         if skipped > 0:
-            logger.info(f"  ⏭ Skipped (already in playlist): {skipped}")
+            summary.append(f"  ⏭ Skipped (already in playlist): {skipped}")
+        logger.info('\n'.join(summary))
         if failed > 0:
-            logger.error(f"  ✗ Failed: {failed} songs")
-            logger.error(f"\nFailed songs:")
-            for fs in failed_songs[:20]:
-                logger.error(f"  - Row {fs['row']}: {fs['title']} by {fs['artists']}")
-                logger.error(f"    Error: {fs['error']}")
-            if len(failed_songs) > 20:
-                logger.error(f"  ... and {len(failed_songs) - 20} more (see log file)")
+            failures = [f"  ✗ Failed: {failed} songs", "\nFailed songs:"]
+            for fs in failed_songs:
+                failures.append(f"  - Row {fs['row']}: {fs['title']} by {fs['artists']}")
+                failures.append(f"    Error: {fs['error']}")
+            if failed > len(failed_songs):
+                failures.append(f"  ... and {failed - len(failed_songs)} more (see log file)")
+            logger.error('\n'.join(failures))
         
         return True
         
@@ -679,6 +1336,7 @@ AUTHENTICATION:
     parser.add_argument('--no-append', action='store_true', help='Always create new playlists instead of appending to existing ones')
     parser.add_argument('--public', action='store_true', help='Create public playlists (default is private)')
     parser.add_argument('--log', default='playlist_import.log', help='Log file path (default: playlist_import.log)')
+    parser.add_argument('--no-cache', action='store_true', help=f'Ignore and do not update the search cache ({SEARCH_CACHE_FILE})')
     
     args = parser.parse_args()
     
@@ -708,8 +1366,7 @@ AUTHENTICATION:
 
     # Validate browser.json contents and add sane defaults if needed
     try:
-        with open('browser.json', 'r', encoding='utf-8') as f:
-            headers = json.load(f)
+        headers = _read_json('browser.json')
     except Exception as e:
         logger.error(f"ERROR reading browser.json: {e}")
         logger.error("Try re-running: python playlist_importer.py --setup")
@@ -740,15 +1397,15 @@ AUTHENTICATION:
 
     if changed:
         try:
-            with open('browser.json', 'w', encoding='utf-8') as f:
-                json.dump(headers, f, indent=2)
+            _write_json('browser.json', headers, indent=True)
             logger.info("Updated browser.json with defaults (Origin) to avoid missing-value errors.")
         except Exception as e:
             logger.warning(f"Could not update browser.json: {e} (continuing with in-memory defaults)")
 
-    # Initialize YouTube Music client
+    # Initialize YouTube Music client; the pool covers the shared search
+    # slots plus each concurrent playlist's own requests
     try:
-        yt = YTMusic('browser.json')
+        yt = YTMusic('browser.json', requests_session=_build_session(SEARCH_WORKERS + PLAYLIST_WORKERS))
         logger.info("✓ Successfully authenticated with YouTube Music")
     except Exception as e:
         logger.error(f"ERROR initializing YouTube Music: {e}")
@@ -756,12 +1413,25 @@ AUTHENTICATION:
         logger.error("  python playlist_importer.py --setup")
         sys.exit(1)
     
+    # Reuse search results from previous runs
+    if not args.no_cache:
+        cached = load_search_cache()
+        if cached:
+            logger.info(f"✓ Loaded {cached} cached search results from {SEARCH_CACHE_FILE}")
+    
+    # Existing playlists are looked up (at most one library listing) and
+    # remembered for the whole run
+    existing_playlists = PlaylistIndex(yt) if append_mode else None
+    
     # Handle Spotify import
     if args.spotify:
         logger.info(f"\nImporting from Spotify: {args.spotify}")
         playlist_data = parse_spotify_playlist(args.spotify)
         if playlist_data:
-            import_playlist(yt, playlist_data['name'], playlist_data, append=append_mode, privacy=privacy)
+            import_playlist(yt, playlist_data['name'], playlist_data, append=append_mode, privacy=privacy,
+                            existing_playlists=existing_playlists)
+            if existing_playlists is not None:
+                existing_playlists.save()
         return
     
     # Handle CSV imports
@@ -791,18 +1461,38 @@ AUTHENTICATION:
     for f in csv_files:
         logger.info(f"  - {f}")
     
+    # Parse every CSV up front; parsing needs no YouTube Music client
+    parsed = parse_csv_files(csv_files, args.log)
+    
     # Process each CSV file
     total_playlists = 0
-    for i, csv_file in enumerate(csv_files, 1):
+    for i, (csv_file, playlists) in enumerate(zip(csv_files, parsed), 1):
         logger.info('#'*70)
         logger.info(f"# Processing file {i}/{len(csv_files)}: {os.path.basename(csv_file)}")
         logger.info(f"{'#'*70}")
         
-        playlists = import_playlist_from_csv(yt, csv_file)
         if playlists:
-            for playlist_name, playlist_data in playlists.items():
-                if import_playlist(yt, playlist_name, playlist_data, append=append_mode, privacy=privacy):
-                    total_playlists += 1
+            # Playlists are independent, so overlap their API calls
+            with ThreadPoolExecutor(max_workers=PLAYLIST_WORKERS) as ex:
+                futures = []
+                try:
+                    for playlist_name, playlist_data in playlists.items():
+                        futures.append(ex.submit(import_playlist, yt, playlist_name, playlist_data,
+                                                 append=append_mode, privacy=privacy,
+                                                 existing_playlists=existing_playlists))
+                    for future in as_completed(futures):
+                        if future.result():
+                            total_playlists += 1
+                except BaseException:
+                    # Ctrl+C only reaches this thread: drop the queued
+                    # playlists and have the running ones stop early
+                    _import_stop.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+    
+    if existing_playlists is not None:
+        existing_playlists.save()
     
     logger.info("="*70)
     logger.info(f"ALL COMPLETE - Imported {total_playlists} playlists from {len(csv_files)} file(s)")